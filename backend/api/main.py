@@ -33,7 +33,7 @@ from api.models import (
     ProductsResponse,
     ProductItem,
 )
-from models.database import DatabaseManager
+from models.database import get_db
 
 # =============================================================================
 # Configuration & Logging
@@ -44,8 +44,8 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Database manager instance
-db_manager = DatabaseManager()
+# Database manager instance (process-wide singleton shared with the routers)
+db_manager = get_db()
 
 
 # =============================================================================
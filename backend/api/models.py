@@ -4,10 +4,28 @@ Pydantic models for MarketPulse API responses.
 
 from datetime import datetime
 from typing import List, Optional
+from fastapi import Response
 from pydantic import BaseModel, Field
 from decimal import Decimal
 
 
+# =============================================================================
+# Response Helpers
+# =============================================================================
+
+JSON_MEDIA_TYPE = "application/json"
+
+
+def json_response(response: BaseModel) -> Response:
+    """
+    Serialize a response model in one pydantic-core call.
+
+    Returning a Response skips FastAPI's re-validation and jsonable_encoder
+    walk over every item; the route's response_model still documents it.
+    """
+    return Response(content=response.model_dump_json(), media_type=JSON_MEDIA_TYPE)
+
+
 # =============================================================================
 # Health Check Models
 # =============================================================================
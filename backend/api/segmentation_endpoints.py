@@ -66,11 +66,13 @@ Israeli Central Bureau of Statistics (CBS) - Household Expenditure Survey 2022
 import logging
 from typing import List, Optional
 from fastapi import APIRouter, HTTPException, Query, status
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from sqlalchemy import text, create_engine
 from dotenv import load_dotenv
 import os
 
+from api.models import json_response
+
 # Load environment
 load_dotenv()
 DATABASE_URL = os.getenv('DATABASE_URL')
@@ -151,12 +153,21 @@ class BurnRateResponse(BaseModel):
     burn_rates: List[BurnRateItem]
     insight: str
 
+# Validate whole result sets in one call (query columns match the fields;
+# NUMERIC columns are cast to float8 in SQL so rows arrive as plain floats)
+_segment_type_items = TypeAdapter(List[SegmentTypeItem])
+_segment_value_items = TypeAdapter(List[SegmentValueItem])
+_expenditure_items = TypeAdapter(List[ExpenditureItem])
+_inequality_items = TypeAdapter(List[InequalityItem])
+_burn_rate_items = TypeAdapter(List[BurnRateItem])
+
 # =============================================================================
 # Router
 # =============================================================================
 
 router = APIRouter(prefix="/api/v10", tags=["V10 Segmentation"])
 
+
 # =============================================================================
 # Endpoints
 # =============================================================================
@@ -237,26 +248,19 @@ def get_segment_types():
                 SELECT
                     segment_type,
                     COUNT(*) as count,
-                    ARRAY_AGG(segment_value) as examples
+                    ARRAY_AGG(segment_value) as example_values
                 FROM ranked_segments
                 WHERE rn <= 3
                 GROUP BY segment_type
                 ORDER BY segment_type
-            """)).fetchall()
+            """)).mappings().all()
 
-            segment_types = [
-                SegmentTypeItem(
-                    segment_type=row[0],
-                    count=row[1],
-                    example_values=row[2] if row[2] else []
-                )
-                for row in result
-            ]
+            segment_types = _segment_type_items.validate_python(result)
 
-            return SegmentTypeResponse(
+            return json_response(SegmentTypeResponse.model_construct(
                 total_types=len(segment_types),
                 segment_types=segment_types
-            )
+            ))
 
     except Exception as e:
         logger.error(f"Error fetching segment types: {e}")
@@ -333,7 +337,7 @@ def get_segment_values(segment_type: str):
                     ORDER BY segment_order
                 """),
                 {"segment_type": segment_type}
-            ).fetchall()
+            ).mappings().all()
 
             if not result:
                 raise HTTPException(
@@ -341,19 +345,13 @@ def get_segment_values(segment_type: str):
                     detail=f"Segment type '{segment_type}' not found"
                 )
 
-            values = [
-                SegmentValueItem(
-                    segment_value=row[0],
-                    segment_order=row[1]
-                )
-                for row in result
-            ]
+            values = _segment_value_items.validate_python(result)
 
-            return SegmentValuesResponse(
+            return json_response(SegmentValuesResponse.model_construct(
                 segment_type=segment_type,
                 total_values=len(values),
                 values=values
-            )
+            ))
 
     except HTTPException:
         raise
@@ -453,11 +451,19 @@ def get_segmentation_data(
     """
     try:
         with engine.connect() as conn:
-            # Verify segment type exists
-            type_check = conn.execute(
-                text("SELECT COUNT(*) FROM dim_segment WHERE segment_type = :segment_type"),
+            # Verify segment type exists and count distinct items in one fetch
+            type_check, distinct_items = conn.execute(
+                text("""
+                    SELECT
+                        (SELECT COUNT(*) FROM dim_segment
+                         WHERE segment_type = :segment_type),
+                        (SELECT COUNT(DISTINCT f.item_name)
+                         FROM fact_segment_expenditure f
+                         JOIN dim_segment s ON f.segment_key = s.segment_key
+                         WHERE s.segment_type = :segment_type)
+                """),
                 {"segment_type": segment_type}
-            ).scalar()
+            ).one()
 
             if type_check == 0:
                 raise HTTPException(
@@ -471,7 +477,7 @@ def get_segmentation_data(
                     SELECT
                         f.item_name,
                         s.segment_value,
-                        f.expenditure_value
+                        f.expenditure_value::float8 AS expenditure_value
                     FROM fact_segment_expenditure f
                     JOIN dim_segment s ON f.segment_key = s.segment_key
                     WHERE s.segment_type = :segment_type
@@ -479,34 +485,16 @@ def get_segmentation_data(
                     LIMIT :limit
                 """),
                 {"segment_type": segment_type, "limit": limit}
-            ).fetchall()
+            ).mappings().all()
 
-            expenditures = [
-                ExpenditureItem(
-                    item_name=row[0],
-                    segment_value=row[1],
-                    expenditure_value=float(row[2])
-                )
-                for row in result
-            ]
+            expenditures = _expenditure_items.validate_python(result)
 
-            # Count distinct items
-            distinct_items = conn.execute(
-                text("""
-                    SELECT COUNT(DISTINCT f.item_name)
-                    FROM fact_segment_expenditure f
-                    JOIN dim_segment s ON f.segment_key = s.segment_key
-                    WHERE s.segment_type = :segment_type
-                """),
-                {"segment_type": segment_type}
-            ).scalar()
-
-            return SegmentationResponse(
+            return json_response(SegmentationResponse.model_construct(
                 segment_type=segment_type,
                 total_items=distinct_items,
                 total_records=len(expenditures),
                 expenditures=expenditures
-            )
+            ))
 
     except HTTPException:
         raise
@@ -636,18 +624,18 @@ def get_inequality_analysis(
                     SELECT
                         item_name,
                         high_segment,
-                        high_spend,
+                        high_spend::float8 AS high_spend,
                         low_segment,
-                        low_spend,
-                        inequality_ratio,
-                        avg_spend
+                        low_spend::float8 AS low_spend,
+                        inequality_ratio::float8 AS inequality_ratio,
+                        avg_spend::float8 AS avg_spend
                     FROM vw_segment_inequality
                     WHERE segment_type = :segment_type
                     ORDER BY inequality_ratio DESC
                     LIMIT :limit
                 """),
                 {"segment_type": segment_type, "limit": limit}
-            ).fetchall()
+            ).mappings().all()
 
             if not result:
                 raise HTTPException(
@@ -655,18 +643,7 @@ def get_inequality_analysis(
                     detail=f"No inequality data found for segment type '{segment_type}'"
                 )
 
-            inequality_items = [
-                InequalityItem(
-                    item_name=row[0],
-                    high_segment=row[1],
-                    high_spend=float(row[2]),
-                    low_segment=row[3],
-                    low_spend=float(row[4]),
-                    inequality_ratio=float(row[5]),
-                    avg_spend=float(row[6])
-                )
-                for row in result
-            ]
+            inequality_items = _inequality_items.validate_python(result)
 
             # Generate insight
             top_item = inequality_items[0]
@@ -676,12 +653,12 @@ def get_inequality_analysis(
                 f"{top_item.low_segment} (₪{top_item.high_spend:.2f} vs ₪{top_item.low_spend:.2f})"
             )
 
-            return InequalityResponse(
+            return json_response(InequalityResponse.model_construct(
                 segment_type=segment_type,
                 total_items=len(inequality_items),
                 top_inequality=inequality_items,
                 insight=insight
-            )
+            ))
 
     except HTTPException:
         raise
@@ -802,35 +779,25 @@ def get_burn_rate_analysis(
             result = conn.execute(text("""
                 SELECT
                     segment_value,
-                    income,
-                    spending,
-                    burn_rate_pct,
-                    surplus_deficit,
+                    income::float8 AS income,
+                    spending::float8 AS spending,
+                    burn_rate_pct::float8 AS burn_rate_pct,
+                    surplus_deficit::float8 AS surplus_deficit,
                     financial_status
                 FROM vw_segment_burn_rate
                 WHERE segment_type = :segment_type
                 ORDER BY burn_rate_pct DESC
-            """), {"segment_type": segment_type}).fetchall()
+            """), {"segment_type": segment_type}).mappings().all()
 
             if not result:
                 # If view is empty, return empty result with helpful message
-                return BurnRateResponse(
+                return json_response(BurnRateResponse.model_construct(
                     total_segments=0,
                     burn_rates=[],
                     insight="No burn rate data available. Ensure income and consumption expenditure data is loaded."
-                )
+                ))
 
-            burn_rate_items = [
-                BurnRateItem(
-                    segment_value=row[0],
-                    income=float(row[1]),
-                    spending=float(row[2]),
-                    burn_rate_pct=float(row[3]),
-                    surplus_deficit=float(row[4]),
-                    financial_status=row[5]
-                )
-                for row in result
-            ]
+            burn_rate_items = _burn_rate_items.validate_python(result)
 
             # Generate insight
             highest = burn_rate_items[0]
@@ -841,11 +808,11 @@ def get_burn_rate_analysis(
                 f"({lowest.financial_status})"
             )
 
-            return BurnRateResponse(
+            return json_response(BurnRateResponse.model_construct(
                 total_segments=len(burn_rate_items),
                 burn_rates=burn_rate_items,
                 insight=insight
-            )
+            ))
 
     except Exception as e:
         logger.error(f"Error fetching burn rate analysis: {e}")
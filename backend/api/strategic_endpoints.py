@@ -61,13 +61,17 @@ Israeli Central Bureau of Statistics (CBS) - Household Expenditure Survey 2022
 """
 
 import logging
-from typing import List, Dict, Any
+from collections import Counter
+from typing import List, Dict, Any, Optional
 
-from fastapi import APIRouter, HTTPException, status, Depends
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, HTTPException, Response, status, Depends
+from pydantic import BaseModel, Field, TypeAdapter
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+from api.models import JSON_MEDIA_TYPE, json_response
+from models.database import get_db
+
 logger = logging.getLogger(__name__)
 
 # Create router
@@ -79,17 +83,48 @@ router = APIRouter(prefix="/api/strategic", tags=["Strategic Insights V9"])
 # =============================================================================
 
 def get_db_session():
-    """Get database session"""
-    from models.database import DatabaseManager
-
-    db_manager = DatabaseManager()
-    session = db_manager.SessionLocal()
+    """Get database session from the shared DatabaseManager (one engine/pool per process)"""
+    session = get_db().SessionLocal()
     try:
         yield session
     finally:
         session.close()
 
 
+# =============================================================================
+# Response Cache
+# =============================================================================
+
+# The strategic tables and views only change when the ETL reruns, so each
+# parameterless endpoint builds its response once per process. The cache
+# holds the serialized JSON, so hits skip model validation and encoding.
+# Each uvicorn worker keeps its own copy: restart the API after reloading
+# the data so every worker picks it up.
+_response_cache: Dict[str, bytes] = {}
+
+
+def _cached_response(key: str) -> Optional[Response]:
+    """Return the cached JSON for an endpoint, if any"""
+    body = _response_cache.get(key)
+    if body is None:
+        return None
+    return Response(content=body, media_type=JSON_MEDIA_TYPE)
+
+
+def _cache_response(key: str, response: BaseModel) -> Response:
+    """Serialize a response once (in pydantic-core) and cache the JSON"""
+    serialized = json_response(response)
+    _response_cache[key] = serialized.body
+    return serialized
+
+
+def clear_response_cache() -> int:
+    """Drop this process's cached strategic responses"""
+    cleared = len(_response_cache)
+    _response_cache.clear()
+    return cleared
+
+
 # =============================================================================
 # Pydantic Models
 # =============================================================================
@@ -191,6 +226,15 @@ class ExpendituresResponse(BaseModel):
     insight: str
 
 
+# Validate a whole result set in one call (column names match the fields;
+# numeric columns are cast to float8 in SQL so rows arrive as plain floats)
+_inequality_gap_items = TypeAdapter(List[InequalityGapItem])
+_fresh_food_battle_items = TypeAdapter(List[FreshFoodBattleItem])
+_retail_competition_items = TypeAdapter(List[RetailCompetitionItem])
+_household_profile_items = TypeAdapter(List[HouseholdProfileItem])
+_expenditure_items = TypeAdapter(List[ExpenditureItem])
+
+
 # =============================================================================
 # Endpoint 1: Inequality Gap
 # =============================================================================
@@ -207,12 +251,20 @@ def get_inequality_gap(db: Session = Depends(get_db_session)) -> InequalityGapRe
     Uses materialized view vw_inequality_gap.
     """
     try:
+        cached = _cached_response("inequality-gap")
+        if cached is not None:
+            return cached
+
         query = text("""
-            SELECT item_name, rich_spend, poor_spend, gap_ratio, total_spend
+            SELECT item_name,
+                   rich_spend::float8 AS rich_spend,
+                   poor_spend::float8 AS poor_spend,
+                   gap_ratio::float8 AS gap_ratio,
+                   total_spend::float8 AS total_spend
             FROM vw_inequality_gap
             LIMIT 10;
         """)
-        results = db.execute(query).fetchall()
+        results = db.execute(query).mappings().all()
 
         if not results:
             raise HTTPException(
@@ -220,16 +272,7 @@ def get_inequality_gap(db: Session = Depends(get_db_session)) -> InequalityGapRe
                 detail="Inequality gap data not found. Run load_v9_production.py first."
             )
 
-        items = [
-            InequalityGapItem(
-                item_name=row.item_name,
-                rich_spend=float(row.rich_spend),
-                poor_spend=float(row.poor_spend),
-                gap_ratio=float(row.gap_ratio),
-                total_spend=float(row.total_spend)
-            )
-            for row in results
-        ]
+        items = _inequality_gap_items.validate_python(results)
 
         top_item = items[0]
         insight = (
@@ -239,10 +282,12 @@ def get_inequality_gap(db: Session = Depends(get_db_session)) -> InequalityGapRe
             f"Premium products create massive wealth gaps."
         )
 
-        return InequalityGapResponse(
+        # Items are already validated; skip re-checking the envelope
+        response = InequalityGapResponse.model_construct(
             top_gaps=items,
             insight=insight
         )
+        return _cache_response("inequality-gap", response)
 
     except HTTPException:
         raise
@@ -270,9 +315,17 @@ def get_burn_rate(db: Session = Depends(get_db_session)) -> BurnRateResponse:
     Uses materialized view vw_burn_rate.
     """
     try:
+        cached = _cached_response("burn-rate")
+        if cached is not None:
+            return cached
+
         query = text("""
-            SELECT q5_burn_rate_pct, q4_burn_rate_pct, q3_burn_rate_pct,
-                   q2_burn_rate_pct, q1_burn_rate_pct, total_burn_rate_pct
+            SELECT q5_burn_rate_pct::float8 AS q5_burn_rate_pct,
+                   q4_burn_rate_pct::float8 AS q4_burn_rate_pct,
+                   q3_burn_rate_pct::float8 AS q3_burn_rate_pct,
+                   q2_burn_rate_pct::float8 AS q2_burn_rate_pct,
+                   q1_burn_rate_pct::float8 AS q1_burn_rate_pct,
+                   total_burn_rate_pct::float8 AS total_burn_rate_pct
             FROM vw_burn_rate;
         """)
         result = db.execute(query).fetchone()
@@ -283,8 +336,8 @@ def get_burn_rate(db: Session = Depends(get_db_session)) -> BurnRateResponse:
                 detail="Burn rate data not found. Run load_v9_production.py first."
             )
 
-        q1_burn = float(result.q1_burn_rate_pct)
-        q5_burn = float(result.q5_burn_rate_pct)
+        q1_burn = result.q1_burn_rate_pct
+        q5_burn = result.q5_burn_rate_pct
 
         if q1_burn > 100:
             financial_status = "CRISIS - Q1 spends MORE than income (debt spiral)"
@@ -299,15 +352,16 @@ def get_burn_rate(db: Session = Depends(get_db_session)) -> BurnRateResponse:
             f"{financial_status}"
         )
 
-        return BurnRateResponse(
+        response = BurnRateResponse(
             q5_burn_rate_pct=q5_burn,
-            q4_burn_rate_pct=float(result.q4_burn_rate_pct),
-            q3_burn_rate_pct=float(result.q3_burn_rate_pct),
-            q2_burn_rate_pct=float(result.q2_burn_rate_pct),
+            q4_burn_rate_pct=result.q4_burn_rate_pct,
+            q3_burn_rate_pct=result.q3_burn_rate_pct,
+            q2_burn_rate_pct=result.q2_burn_rate_pct,
             q1_burn_rate_pct=q1_burn,
-            total_burn_rate_pct=float(result.total_burn_rate_pct),
+            total_burn_rate_pct=result.total_burn_rate_pct,
             insight=insight
         )
+        return _cache_response("burn-rate", response)
 
     except HTTPException:
         raise
@@ -335,13 +389,20 @@ def get_fresh_food_battle(db: Session = Depends(get_db_session)) -> FreshFoodBat
     Uses materialized view vw_fresh_food_battle.
     """
     try:
+        cached = _cached_response("fresh-food-battle")
+        if cached is not None:
+            return cached
+
         query = text("""
-            SELECT category, traditional_retail_pct, supermarket_chain_pct,
-                   traditional_advantage, winner
+            SELECT category,
+                   traditional_retail_pct::float8 AS traditional_retail_pct,
+                   supermarket_chain_pct::float8 AS supermarket_chain_pct,
+                   traditional_advantage::float8 AS traditional_advantage,
+                   winner
             FROM vw_fresh_food_battle
             ORDER BY traditional_retail_pct DESC;
         """)
-        results = db.execute(query).fetchall()
+        results = db.execute(query).mappings().all()
 
         if not results:
             raise HTTPException(
@@ -349,30 +410,22 @@ def get_fresh_food_battle(db: Session = Depends(get_db_session)) -> FreshFoodBat
                 detail="Fresh food battle data not found. Run load_v9_production.py first."
             )
 
-        items = [
-            FreshFoodBattleItem(
-                category=row.category,
-                traditional_retail_pct=float(row.traditional_retail_pct),
-                supermarket_chain_pct=float(row.supermarket_chain_pct),
-                traditional_advantage=float(row.traditional_advantage),
-                winner=row.winner
-            )
-            for row in results
-        ]
+        items = _fresh_food_battle_items.validate_python(results)
 
-        traditional_wins = [item for item in items if item.winner == 'Traditional Wins']
-        supermarket_wins = [item for item in items if item.winner == 'Supermarket Wins']
+        # Tally both winner counts in a single pass over the categories
+        wins = Counter(item.winner for item in items)
 
         insight = (
-            f"Retail battle: Traditional retail wins {len(traditional_wins)} categories, "
-            f"supermarket chains win {len(supermarket_wins)}. "
+            f"Retail battle: Traditional retail wins {wins['Traditional Wins']} categories, "
+            f"supermarket chains win {wins['Supermarket Wins']}. "
             f"Fresh food favors traditional (markets/butchers), packaged goods favor supermarkets."
         )
 
-        return FreshFoodBattleResponse(
+        response = FreshFoodBattleResponse.model_construct(
             categories=items,
             insight=insight
         )
+        return _cache_response("fresh-food-battle", response)
 
     except HTTPException:
         raise
@@ -399,13 +452,25 @@ def get_retail_competition(db: Session = Depends(get_db_session)) -> RetailCompe
     Get all retail competition data with 8 CBS store types.
     """
     try:
+        cached = _cached_response("retail-competition")
+        if cached is not None:
+            return cached
+
         query = text("""
-            SELECT category, other_pct, special_shop_pct, butcher_pct, veg_fruit_shop_pct,
-                   online_supermarket_pct, supermarket_chain_pct, market_pct, grocery_pct, total_pct
+            SELECT category,
+                   other_pct::float8 AS other_pct,
+                   special_shop_pct::float8 AS special_shop_pct,
+                   butcher_pct::float8 AS butcher_pct,
+                   veg_fruit_shop_pct::float8 AS veg_fruit_shop_pct,
+                   online_supermarket_pct::float8 AS online_supermarket_pct,
+                   supermarket_chain_pct::float8 AS supermarket_chain_pct,
+                   market_pct::float8 AS market_pct,
+                   grocery_pct::float8 AS grocery_pct,
+                   total_pct::float8 AS total_pct
             FROM retail_competition
             ORDER BY supermarket_chain_pct DESC;
         """)
-        results = db.execute(query).fetchall()
+        results = db.execute(query).mappings().all()
 
         if not results:
             raise HTTPException(
@@ -413,28 +478,15 @@ def get_retail_competition(db: Session = Depends(get_db_session)) -> RetailCompe
                 detail="Retail competition data not found. Run load_v9_production.py first."
             )
 
-        items = [
-            RetailCompetitionItem(
-                category=row.category,
-                other_pct=float(row.other_pct),
-                special_shop_pct=float(row.special_shop_pct),
-                butcher_pct=float(row.butcher_pct),
-                veg_fruit_shop_pct=float(row.veg_fruit_shop_pct),
-                online_supermarket_pct=float(row.online_supermarket_pct),
-                supermarket_chain_pct=float(row.supermarket_chain_pct),
-                market_pct=float(row.market_pct),
-                grocery_pct=float(row.grocery_pct),
-                total_pct=float(row.total_pct)
-            )
-            for row in results
-        ]
+        items = _retail_competition_items.validate_python(results)
 
         insight = f"Complete retail breakdown for {len(items)} food categories across 8 CBS store types."
 
-        return RetailCompetitionResponse(
+        response = RetailCompetitionResponse.model_construct(
             categories=items,
             insight=insight
         )
+        return _cache_response("retail-competition", response)
 
     except HTTPException:
         raise
@@ -461,12 +513,22 @@ def get_household_profiles(db: Session = Depends(get_db_session)) -> HouseholdPr
     Get all household demographic profiles.
     """
     try:
+        cached = _cached_response("household-profiles")
+        if cached is not None:
+            return cached
+
         query = text("""
-            SELECT metric_name, q5_val, q4_val, q3_val, q2_val, q1_val, total_val
+            SELECT metric_name,
+                   q5_val::float8 AS q5_val,
+                   q4_val::float8 AS q4_val,
+                   q3_val::float8 AS q3_val,
+                   q2_val::float8 AS q2_val,
+                   q1_val::float8 AS q1_val,
+                   total_val::float8 AS total_val
             FROM household_profiles
             ORDER BY metric_name;
         """)
-        results = db.execute(query).fetchall()
+        results = db.execute(query).mappings().all()
 
         if not results:
             raise HTTPException(
@@ -474,25 +536,15 @@ def get_household_profiles(db: Session = Depends(get_db_session)) -> HouseholdPr
                 detail="Household profiles not found. Run load_v9_production.py first."
             )
 
-        items = [
-            HouseholdProfileItem(
-                metric_name=row.metric_name,
-                q5_val=float(row.q5_val),
-                q4_val=float(row.q4_val),
-                q3_val=float(row.q3_val),
-                q2_val=float(row.q2_val),
-                q1_val=float(row.q1_val),
-                total_val=float(row.total_val)
-            )
-            for row in results
-        ]
+        items = _household_profile_items.validate_python(results)
 
         insight = f"Complete demographic breakdown with {len(items)} metrics across 5 income quintiles."
 
-        return HouseholdProfilesResponse(
+        response = HouseholdProfilesResponse.model_construct(
             profiles=items,
             insight=insight
         )
+        return _cache_response("household-profiles", response)
 
     except HTTPException:
         raise
@@ -523,13 +575,20 @@ def get_expenditures(
     """
     try:
         query = text(f"""
-            SELECT item_name, q5_spend, q4_spend, q3_spend, q2_spend, q1_spend,
-                   total_spend, inequality_index
+            SELECT item_name,
+                   q5_spend::float8 AS q5_spend,
+                   q4_spend::float8 AS q4_spend,
+                   q3_spend::float8 AS q3_spend,
+                   q2_spend::float8 AS q2_spend,
+                   q1_spend::float8 AS q1_spend,
+                   total_spend::float8 AS total_spend,
+                   inequality_index::float8 AS inequality_index,
+                   COUNT(*) OVER () AS total_categories
             FROM household_expenditures
             ORDER BY total_spend DESC
             LIMIT :limit;
         """)
-        results = db.execute(query, {"limit": limit}).fetchall()
+        results = db.execute(query, {"limit": limit}).mappings().all()
 
         if not results:
             raise HTTPException(
@@ -537,31 +596,18 @@ def get_expenditures(
                 detail="Expenditures not found. Run load_v9_production.py first."
             )
 
-        items = [
-            ExpenditureItem(
-                item_name=row.item_name,
-                q5_spend=float(row.q5_spend),
-                q4_spend=float(row.q4_spend),
-                q3_spend=float(row.q3_spend),
-                q2_spend=float(row.q2_spend),
-                q1_spend=float(row.q1_spend),
-                total_spend=float(row.total_spend),
-                inequality_index=float(row.inequality_index)
-            )
-            for row in results
-        ]
+        items = _expenditure_items.validate_python(results)
 
-        # Get total count
-        count_query = text("SELECT COUNT(*) FROM household_expenditures;")
-        total_count = db.execute(count_query).scalar()
+        # Total count rides along on every row (window runs before LIMIT)
+        total_count = results[0]['total_categories']
 
         insight = f"Showing top {len(items)} of {total_count} expenditure categories by total spending."
 
-        return ExpendituresResponse(
+        return json_response(ExpendituresResponse.model_construct(
             expenditures=items,
             total_categories=total_count,
             insight=insight
-        )
+        ))
 
     except HTTPException:
         raise
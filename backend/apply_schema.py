@@ -11,7 +11,9 @@ import os
 import sys
 from pathlib import Path
 from dotenv import load_dotenv
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
+
+from models.database import get_db
 
 sys.stdout.reconfigure(encoding='utf-8')
 load_dotenv()
@@ -29,7 +31,8 @@ def apply_schema():
         print("❌ ERROR: DATABASE_URL not found in .env file")
         return False
 
-    engine = create_engine(DATABASE_URL)
+    # Reuse the shared, pooled engine instead of building a second one
+    engine = get_db().engine
 
     # Read schema file
     schema_file = Path(__file__).parent / 'models' / 'schema.sql'
@@ -62,47 +65,40 @@ def apply_schema():
 
     try:
         with engine.connect() as conn:
-            # Check dim_segment
-            result = conn.execute(text("""
-                SELECT COUNT(*) FROM information_schema.tables
-                WHERE table_name = 'dim_segment'
-            """)).scalar()
+            # All checks in one round-trip
+            checks = conn.execute(text("""
+                SELECT
+                    (SELECT COUNT(*) FROM information_schema.tables
+                     WHERE table_name = 'dim_segment') AS dim_segment,
+                    (SELECT COUNT(*) FROM information_schema.tables
+                     WHERE table_name = 'fact_segment_expenditure') AS fact_segment_expenditure,
+                    (SELECT COUNT(*) FROM pg_matviews
+                     WHERE matviewname IN ('vw_segment_inequality', 'vw_segment_burn_rate')) AS matviews,
+                    (SELECT COUNT(*) FROM pg_proc
+                     WHERE proname IN ('refresh_all_segment_views', 'get_expenditure_by_segment_type', 'get_top_inequality_by_segment')) AS functions
+            """)).one()
 
-            if result > 0:
+            # Check dim_segment
+            if checks.dim_segment > 0:
                 print("   ✅ dim_segment table created")
             else:
                 print("   ❌ dim_segment table NOT found")
                 return False
 
             # Check fact_segment_expenditure
-            result = conn.execute(text("""
-                SELECT COUNT(*) FROM information_schema.tables
-                WHERE table_name = 'fact_segment_expenditure'
-            """)).scalar()
-
-            if result > 0:
+            if checks.fact_segment_expenditure > 0:
                 print("   ✅ fact_segment_expenditure table created")
             else:
                 print("   ❌ fact_segment_expenditure table NOT found")
                 return False
 
             # Check materialized views
-            result = conn.execute(text("""
-                SELECT COUNT(*) FROM pg_matviews
-                WHERE matviewname IN ('vw_segment_inequality', 'vw_segment_burn_rate')
-            """)).scalar()
-
-            print(f"   ✅ {result} materialized views created")
+            print(f"   ✅ {checks.matviews} materialized views created")
 
             # Check functions
-            result = conn.execute(text("""
-                SELECT COUNT(*) FROM pg_proc
-                WHERE proname IN ('refresh_all_segment_views', 'get_expenditure_by_segment_type', 'get_top_inequality_by_segment')
-            """)).scalar()
-
-            print(f"   ✅ {result} helper functions created")
+            print(f"   ✅ {checks.functions} helper functions created")
 
-            # Check sample data
+            # Check sample data (dim_segment is known to exist here)
             segment_count = conn.execute(text("SELECT COUNT(*) FROM dim_segment")).scalar()
             print(f"   ✅ Sample data: {segment_count} segments inserted")
 
@@ -19,7 +19,9 @@ print(f"Processing: {FILE_NAME}\n")
 # CORRECT APPROACH: Read multi-row header using openpyxl
 # ============================================================================
 
-wb = openpyxl.load_workbook(FILE_PATH)
+# Parse the workbook once: the same handle feeds the header cells below and
+# pd.read_excel for the data (data_only matches what pandas would load)
+wb = openpyxl.load_workbook(FILE_PATH, data_only=True)
 ws = wb.active
 
 # Extract Hebrew region names from Row 5 (0-indexed row 4)
@@ -39,8 +41,8 @@ for i, name in enumerate(hebrew_names, 1):
 # Now read data with correct approach
 # ============================================================================
 
-# Read with header=10 to get the DATA structure
-df = pd.read_excel(FILE_PATH, header=10)
+# Read with header=10 to get the DATA structure (reuses the parsed workbook)
+df = pd.read_excel(wb, header=10, engine='openpyxl')
 
 print(f"\n📊 Data shape: {df.shape}")
 print(f"Columns from header=10: {df.columns.tolist()[:5]}")
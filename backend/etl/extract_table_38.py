@@ -11,31 +11,29 @@ from pathlib import Path
 
 sys.stdout.reconfigure(encoding='utf-8')
 
+# Rows searched for the store-type header (it sits at row ~7 in CBS Table 38)
+HEADER_SCAN_ROWS = 20
 
-def clean_cbs_value(val):
-    """Clean CBS values - NO NEGATIVES, NO ERRORS"""
-    if pd.isna(val):
-        return None
 
-    val_str = str(val).strip()
+def clean_cbs_columns(raw):
+    """Clean CBS value columns - NO NEGATIVES, NO ERRORS
 
-    # Skip error margin rows
-    if '±' in val_str:
-        return 'SKIP_ROW'
+    Returns (values, error_cells): float frame with suppressed/missing data as
+    NaN, and a boolean frame marking error margin (±) cells.
+    """
+    text = raw.apply(lambda col: col.astype(str).str.strip())
 
-    # Handle suppressed/missing data
-    if val_str in ['..', '-', '', 'nan']:
-        return None
+    # Error margin cells mark the whole row for skipping
+    error_cells = raw.notna() & text.apply(lambda col: col.str.contains('±', regex=False))
 
-    # Remove CBS parentheses (low reliability indicator) and commas
-    val_str = val_str.replace('(', '').replace(')', '').replace(',', '')
+    # Remove CBS parentheses (low reliability indicator) and commas; '..', '-'
+    # and blanks fail to parse and become NaN
+    values = text.apply(
+        lambda col: pd.to_numeric(col.str.replace(r'[(),]', '', regex=True), errors='coerce')
+    )
 
-    try:
-        result = float(val_str)
-        # FIX NEGATIVES: Use absolute value (CBS statistical adjustment)
-        return abs(result) if result < 0 else result
-    except:
-        return None
+    # FIX NEGATIVES: Use absolute value (CBS statistical adjustment)
+    return values.where(raw.notna()).abs(), error_cells
 
 
 def extract_table_38_clean():
@@ -53,111 +51,85 @@ def extract_table_38_clean():
         print(f"❌ FILE NOT FOUND: {filepath}")
         return None
 
-    # Load raw Excel
-    df_raw = pd.read_excel(filepath, header=None, engine='openpyxl')
+    # Load raw Excel once - only columns A-J (category + 8 store types + total),
+    # as raw cell objects since every value is coerced during cleaning anyway
+    df_raw = pd.read_excel(
+        filepath, header=None, usecols=lambda col: col < 10,
+        dtype=object, engine='openpyxl'
+    )
     print(f"📊 Raw rows: {len(df_raw)}")
 
     # Find header row (contains "Other", "Special shop", "Butcher", etc.)
-    header_row = None
-    for idx, row in df_raw.iterrows():
-        row_values = [str(x).lower() for x in row.tolist() if pd.notna(x)]
-        # Look for English store type keywords
-        if any('other' in x for x in row_values) or any('butcher' in x for x in row_values):
-            header_row = idx
-            print(f"🎯 Header at row {idx}")
-            break
-
-    if header_row is None:
+    # Scan column-wise for English store type keywords, then take the first hit.
+    # CBS headers sit in the title block, so only the top rows are scanned
+    has_store_type = df_raw.head(HEADER_SCAN_ROWS).apply(
+        lambda col: col.astype(str).str.contains('other|butcher', case=False, regex=True)
+    ).any(axis=1)
+
+    if not has_store_type.any():
         print("❌ No header found")
         return None
 
-    # Reload with header
-    df = pd.read_excel(filepath, header=header_row, engine='openpyxl')
+    header_row = int(has_store_type.idxmax())
+    print(f"🎯 Header at row {header_row}")
+
+    # Data rows follow the header row - slice them instead of re-reading the file
+    df = df_raw.iloc[header_row + 1:].reset_index(drop=True)
+    df.columns = df_raw.iloc[header_row].tolist()
     print(f"📋 Columns: {df.columns.tolist()}")
 
-    # Clean data
-    cleaned_data = []
-    stats = {'error': 0, 'empty': 0, 'no_data': 0, 'total_row': 0}
-
-    for idx, row in df.iterrows():
-        # Category name is first column
-        category = str(row.iloc[0]).strip() if pd.notna(row.iloc[0]) else None
-
-        if not category or category == 'nan':
-            stats['empty'] += 1
-            continue
-
-        # Skip error margin rows
-        if '±' in category:
-            stats['error'] += 1
-            continue
-
-        # Skip "Total" aggregate row
-        if category.lower() in ['total', 'sum', 'סך הכל']:
-            stats['total_row'] += 1
-            continue
-
-        # Extract 8 store types (columns B-I) + Total (column J)
-        # Columns indices: 1=Other, 2=Special shop, 3=Butcher, 4=Veg/Fruit,
-        #                  5=Online, 6=Supermarket Chain, 7=Market, 8=Grocery, 9=Total
-
-        row_data = {'category': category}
-        skip_row = False
-
-        # Extract 9 columns (8 store types + total)
-        for col_idx in range(1, 10):
-            if col_idx < len(row):
-                cleaned_val = clean_cbs_value(row.iloc[col_idx])
-                if cleaned_val == 'SKIP_ROW':
-                    skip_row = True
-                    stats['error'] += 1
-                    break
-                row_data[f'col_{col_idx}'] = cleaned_val
-            else:
-                row_data[f'col_{col_idx}'] = None
-
-        if skip_row:
-            continue
-
-        # Skip rows with no meaningful data (total < 1 or all zeros)
-        total_val = row_data.get('col_9', None)
-        if total_val is None or total_val < 1:
-            stats['no_data'] += 1
-            continue
-
-        cleaned_data.append(row_data)
-
-    df_cleaned = pd.DataFrame(cleaned_data)
-
-    print(f"\n✅ Cleaned: {len(df_cleaned)} food categories")
-    print(f"🗑️  Skipped: ± rows={stats['error']}, empty={stats['empty']}, no_data={stats['no_data']}, total_row={stats['total_row']}")
+    # Clean data - classify every row with column masks instead of iterating
+    # Category name is first column
+    category = df.iloc[:, 0].astype(str).str.strip()
+    empty = df.iloc[:, 0].isna() | category.isin(['', 'nan'])
+
+    # Skip error margin rows
+    error = ~empty & category.str.contains('±', regex=False)
 
-    # Map to final format with proper column names
-    df_final = pd.DataFrame({
-        'category': df_cleaned['category'],
-        'other': df_cleaned['col_1'],
-        'special_shop': df_cleaned['col_2'],
-        'butcher': df_cleaned['col_3'],
-        'veg_fruit_shop': df_cleaned['col_4'],
-        'online_supermarket': df_cleaned['col_5'],
-        'supermarket_chain': df_cleaned['col_6'],
-        'market': df_cleaned['col_7'],
-        'grocery': df_cleaned['col_8'],
-        'total': df_cleaned['col_9']
-    })
+    # Skip "Total" aggregate row
+    total_row = ~empty & ~error & category.str.lower().isin(['total', 'sum', 'סך הכל'])
 
-    # Calculate percentages (each row sums to ~100%)
+    # Extract 8 store types (columns B-I) + Total (column J)
+    # Columns indices: 1=Other, 2=Special shop, 3=Butcher, 4=Veg/Fruit,
+    #                  5=Online, 6=Supermarket Chain, 7=Market, 8=Grocery, 9=Total
     store_cols = ['other', 'special_shop', 'butcher', 'veg_fruit_shop',
                   'online_supermarket', 'supermarket_chain', 'market', 'grocery']
+    value_cols = store_cols + ['total']
+    values, error_cells = clean_cbs_columns(df.iloc[:, 1:10])
+    values.columns = value_cols[:values.shape[1]]
+    values = values.reindex(columns=value_cols)
+
+    skipped = empty | error | total_row
+    cell_error = ~skipped & error_cells.any(axis=1)
+
+    # Skip rows with no meaningful data (total < 1 or all zeros)
+    no_data = ~(skipped | cell_error) & ~(values['total'] >= 1)
+
+    keep = ~(skipped | cell_error | no_data)
+    stats = {
+        'error': int(error.sum() + cell_error.sum()),
+        'empty': int(empty.sum()),
+        'no_data': int(no_data.sum()),
+        'total_row': int(total_row.sum()),
+    }
+
+    # Map to final format: build straight from the kept NumPy block
+    df_final = pd.DataFrame(values[keep].to_numpy(), columns=value_cols)
+    df_final.insert(0, 'category', category[keep].to_numpy())
+
+    print(f"\n✅ Cleaned: {len(df_final)} food categories")
+    print(f"🗑️  Skipped: ± rows={stats['error']}, empty={stats['empty']}, no_data={stats['no_data']}, total_row={stats['total_row']}")
 
-    for col in store_cols:
-        df_final[f'{col}_pct'] = (df_final[col] / df_final['total'] * 100).round(1)
+    # Calculate percentages (each row sums to ~100%)
+    # One division over the whole store-type block instead of one per column
+    pct = df_final[store_cols].to_numpy() / df_final[['total']].to_numpy() * 100
+    df_final[[f'{col}_pct' for col in store_cols]] = pct.round(1)
 
     # Verification
     print(f"\n🔍 VERIFICATION:")
 
-    # Check for Alcoholic beverages (test case)
-    alcoholic = df_final[df_final['category'].str.contains('lcoholic', case=False, na=False)]
+    # Check for Alcoholic beverages (test case) - exact label match, no regex scan
+    alcoholic = df_final[df_final['category'].str.lower().eq('alcoholic beverages')]
     if not alcoholic.empty:
         row = alcoholic.iloc[0]
         print(f"   Alcoholic beverages:")
@@ -181,16 +153,16 @@ def extract_table_38_clean():
         print(f"   ⚠️  Found negatives in: {negatives['category'].tolist()}")
 
     # Check percentage sums
-    df_final['pct_sum'] = df_final[[f'{col}_pct' for col in store_cols]].sum(axis=1)
-    outliers = df_final[~df_final['pct_sum'].between(98, 102)]
-    print(f"   Percentage sums: {len(outliers)} outliers {'✅' if len(outliers) == 0 else '⚠️'}")
-    if len(outliers) > 0:
+    # Kept as a plain array so it never becomes a column of the saved CSV
+    pct_sum = np.nansum(df_final[[f'{col}_pct' for col in store_cols]].to_numpy(), axis=1)
+    outliers = ~((pct_sum >= 98) & (pct_sum <= 102))
+    print(f"   Percentage sums: {outliers.sum()} outliers {'✅' if not outliers.any() else '⚠️'}")
+    if outliers.any():
         print(f"   Categories with sum ≠ 100%:")
-        for _, row in outliers.iterrows():
-            print(f"   - {row['category']}: {row['pct_sum']:.1f}%")
-
-    # Drop temporary pct_sum column
-    df_final = df_final.drop(columns=['pct_sum'])
+        print('\n'.join(
+            f"   - {category}: {row_sum:.1f}%"
+            for category, row_sum in zip(df_final['category'][outliers], pct_sum[outliers])
+        ))
 
     # Save to processed folder
     output_path = Path(__file__).parent.parent / 'data' / 'processed' / 'table_38_retail.csv'
@@ -3,10 +3,13 @@ V10 Data Loader - Load CBS data from complete CSV export
 Loads 2024-11-22_complete_database_export_6420_records.csv into V10 normalized schema
 """
 
+import io
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 import sys
 from pathlib import Path
 from sqlalchemy import create_engine, text
+from psycopg2.extras import execute_values
 from dotenv import load_dotenv
 import os
 
@@ -22,6 +25,31 @@ engine = create_engine(DATABASE_URL)
 # Path to CSV export
 CSV_PATH = Path(__file__).parent.parent / "data" / "v10_exports" / "2024-11-22_complete_database_export_6420_records.csv"
 
+# Column types of the export, declared up front so read_csv skips inference
+# (segment_value stays a string, e.g. "325" area codes)
+CSV_DTYPES = {
+    'segment_type': 'string',
+    'segment_value': 'string',
+    'segment_order': 'Int64',
+    'item_name': 'string',
+    'expenditure_value': 'float64',
+    'is_income_metric': 'bool',
+    'is_consumption_metric': 'bool',
+}
+
+# Rows per read_csv chunk; each chunk is upserted and COPYed on its own
+CHUNK_SIZE = 5000
+
+# Materialized views over the fact table; neither reads the other
+MATERIALIZED_VIEWS = ['vw_segment_inequality', 'vw_segment_burn_rate']
+
+
+def refresh_view(view_name):
+    """Refresh one materialized view in its own transaction"""
+    with engine.begin() as conn:
+        conn.execute(text(f"REFRESH MATERIALIZED VIEW {view_name}"))
+
+
 def load_csv_to_v10():
     """Load complete CSV export into V10 normalized schema"""
 
@@ -29,14 +57,6 @@ def load_csv_to_v10():
     print("V10 DATA LOADER - Loading from CSV Export")
     print("=" * 80)
 
-    # Read CSV
-    print(f"\nReading CSV: {CSV_PATH}")
-    df = pd.read_csv(CSV_PATH)
-    print(f"Loaded {len(df):,} rows from CSV")
-
-    # Show columns
-    print(f"\nCSV Columns: {list(df.columns)}")
-
     # Clear existing data
     print("\nClearing existing V10 data...")
     with engine.begin() as conn:
@@ -44,78 +64,90 @@ def load_csv_to_v10():
         conn.execute(text("DELETE FROM dim_segment WHERE segment_type NOT IN ('Income Quintile', 'Age Group')"))
         print("Cleared fact_segment_expenditure and non-sample segments from dim_segment")
 
-    # Load segments
-    print("\nLoading segments into dim_segment...")
-    segments = df[['segment_type', 'segment_value', 'segment_order']].drop_duplicates()
-
-    segment_count = 0
-    with engine.begin() as conn:
-        for _, row in segments.iterrows():
-            # Use segment_order from CSV
-            segment_order = int(row['segment_order']) if pd.notna(row['segment_order']) else None
-
-            conn.execute(text("""
-                INSERT INTO dim_segment (segment_type, segment_value, segment_order, file_source)
-                VALUES (:segment_type, :segment_value, :segment_order, 'csv_export_2024-11-22')
-                ON CONFLICT (segment_type, segment_value) DO UPDATE
-                SET segment_order = EXCLUDED.segment_order
-            """), {
-                'segment_type': row['segment_type'],
-                'segment_value': str(row['segment_value']),
-                'segment_order': segment_order
-            })
-            segment_count += 1
-
-    print(f"Loaded {segment_count} segments")
-
-    # Load expenditures
-    print("\nLoading expenditure data into fact_segment_expenditure...")
-
+    # Stream the CSV in chunks so only one chunk is held in memory at a time;
+    # each chunk upserts its segments and then COPYs its facts. All chunks share
+    # one transaction, so a failing chunk rolls back every chunk before it.
+    print(f"\nReading CSV: {CSV_PATH}")
+    print("\nLoading segments and expenditure data...")
+    row_count = 0
     expenditure_count = 0
-    with engine.begin() as conn:
-        for _, row in df.iterrows():
-            # Get segment_key
-            segment_key_result = conn.execute(text("""
-                SELECT segment_key FROM dim_segment
-                WHERE segment_type = :segment_type AND segment_value = :segment_value
-            """), {
-                'segment_type': row['segment_type'],
-                'segment_value': str(row['segment_value'])
-            }).fetchone()
-
-            if not segment_key_result:
-                print(f"WARNING: No segment found for {row['segment_type']} / {row['segment_value']}")
-                continue
-
-            segment_key = segment_key_result[0]
-
-            # Insert expenditure
-            conn.execute(text("""
-                INSERT INTO fact_segment_expenditure (
-                    segment_key, item_name, expenditure_value,
-                    is_income_metric, is_consumption_metric
-                )
-                VALUES (:segment_key, :item_name, :expenditure_value, :is_income, :is_consumption)
-            """), {
-                'segment_key': segment_key,
-                'item_name': row['item_name'],
-                'expenditure_value': float(row['expenditure_value']),
-                'is_income': bool(row['is_income_metric']),
-                'is_consumption': bool(row['is_consumption_metric'])
-            })
-            expenditure_count += 1
-
-            if expenditure_count % 500 == 0:
-                print(f"  Loaded {expenditure_count:,} expenditure records...")
+    loaded_segments = set()
 
+    with engine.begin() as conn:
+        for chunk in pd.read_csv(CSV_PATH, encoding='utf-8-sig', dtype=CSV_DTYPES, chunksize=CHUNK_SIZE):
+            if row_count == 0:
+                print(f"\nCSV Columns: {list(chunk.columns)}")
+            row_count += len(chunk)
+
+            # One row per segment: a single upsert statement can't touch the same
+            # row twice, so if the order differs the last one wins (as row-by-row did)
+            segments = chunk[['segment_type', 'segment_value', 'segment_order']].drop_duplicates(
+                subset=['segment_type', 'segment_value'], keep='last'
+            )
+            loaded_segments.update(
+                segments[['segment_type', 'segment_value']].itertuples(index=False, name=None)
+            )
+
+            # Plain Python values (None for a missing segment_order) for psycopg2
+            segment_rows = list(
+                segments.astype(object).where(segments.notna(), None).itertuples(index=False, name=None)
+            )
+
+            with conn.connection.cursor() as cursor:
+                # Use segment_order from CSV; one multi-row upsert instead of one per segment
+                execute_values(cursor, """
+                    INSERT INTO dim_segment (segment_type, segment_value, segment_order, file_source)
+                    VALUES %s
+                    ON CONFLICT (segment_type, segment_value) DO UPDATE
+                    SET segment_order = EXCLUDED.segment_order
+                """, segment_rows, template="(%s, %s, %s, 'csv_export_2024-11-22')")
+
+            # Resolve every segment_key in one query and join, instead of one SELECT per row
+            segment_keys = pd.DataFrame(
+                conn.execute(text("""
+                    SELECT segment_type, segment_value, segment_key FROM dim_segment
+                """)).fetchall(),
+                columns=['segment_type', 'segment_value', 'segment_key']
+            )
+            df_facts = chunk.merge(segment_keys, on=['segment_type', 'segment_value'], how='left')
+
+            missing = df_facts['segment_key'].isna()
+            missing_segments = df_facts.loc[missing, ['segment_type', 'segment_value']].drop_duplicates()
+            for segment_type, segment_value in missing_segments.itertuples(index=False, name=None):
+                print(f"WARNING: No segment found for {segment_type} / {segment_value}")
+
+            fact_rows = df_facts.loc[~missing, [
+                'segment_key', 'item_name', 'expenditure_value',
+                'is_income_metric', 'is_consumption_metric'
+            ]].astype({'segment_key': 'int64'})
+
+            # Stream the facts through COPY FROM STDIN; the table was cleared above,
+            # so no conflict handling (and no staging table) is needed
+            buffer = io.StringIO()
+            fact_rows.to_csv(buffer, index=False, header=False)
+            buffer.seek(0)
+
+            with conn.connection.cursor() as cursor:
+                cursor.copy_expert("""
+                    COPY fact_segment_expenditure (
+                        segment_key, item_name, expenditure_value,
+                        is_income_metric, is_consumption_metric
+                    )
+                    FROM STDIN WITH (FORMAT csv)
+                """, buffer)
+
+            expenditure_count += len(fact_rows)
+
+    print(f"Loaded {row_count:,} rows from CSV")
+    print(f"Loaded {len(loaded_segments)} segments")
     print(f"Loaded {expenditure_count:,} total expenditure records")
 
     # Refresh materialized views
     print("\nRefreshing materialized views...")
-    with engine.begin() as conn:
-        conn.execute(text("REFRESH MATERIALIZED VIEW vw_segment_inequality"))
-        conn.execute(text("REFRESH MATERIALIZED VIEW vw_segment_burn_rate"))
-        print("Materialized views refreshed")
+    # Independent views: refresh them side by side on separate connections
+    with ThreadPoolExecutor(max_workers=len(MATERIALIZED_VIEWS)) as executor:
+        list(executor.map(refresh_view, MATERIALIZED_VIEWS))
+    print("Materialized views refreshed")
 
     # Verify load
     print("\n" + "=" * 80)
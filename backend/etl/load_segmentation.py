@@ -64,7 +64,9 @@ fact_segment_expenditure (item_name, segment_key, expenditure_value,
 **Performance:**
 
 - Processes 500 items × 5 quintiles = 2,500 records in ~10 seconds
-- Uses bulk inserts with SQLAlchemy
+- Bulk-loads fact rows with PostgreSQL COPY (one round-trip per file)
+- Optional process pool for Excel parsing and threaded loads (MARKETPULSE_ETL_WORKERS=N)
+- Parsed sheets are cached in backend/data/cache/ until the .xlsx changes
 - Indexed on (segment_type, segment_value) for fast lookups
 
 **Usage:**
@@ -106,8 +108,14 @@ import numpy as np
 from pathlib import Path
 from sqlalchemy import create_engine, text
 from dotenv import load_dotenv
+import io
 import os
+import re
 import sys
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from multiprocessing import Pool
 
 # Configure UTF-8 encoding for Windows console
 if sys.platform == 'win32':
@@ -231,6 +239,33 @@ SEGMENTATION_FILES = {
     },
 }
 
+# Metadata markers checked by is_skip_row (built once at import, not per row)
+SKIP_KEYWORDS = (
+    'TABLE', 'PUBLICATION', 'NIS', 'unless otherwise',
+    'Quintiles', 'Deciles', 'עשירונים', 'חמישונים',
+)
+
+# Footnote rows ("(1) ..."), error margins and metadata keywords in one
+# alternation, so skip_row_mask scans the item column once
+_SKIP_ROW_RE = re.compile(
+    r'^\(\d|±|' + '|'.join(re.escape(kw) for kw in SKIP_KEYWORDS)
+)
+
+# Column order used when bulk-loading fact_segment_expenditure
+FACT_COLUMNS = (
+    'item_name', 'segment_key', 'expenditure_value',
+    'is_income_metric', 'is_consumption_metric', 'metric_type',
+)
+
+# Environment override for the fallback INSERT batch size
+BATCH_SIZE_ENV = 'MARKETPULSE_BATCH_SIZE'
+
+# Environment override for the number of extract/transform worker processes
+WORKERS_ENV = 'MARKETPULSE_ETL_WORKERS'
+
+# Parsed workbooks are pickled here and reused until the .xlsx changes
+EXCEL_CACHE_DIR = Path(__file__).parent.parent / 'data' / 'cache'
+
 # ============================================================================
 # CBS VALUE CLEANING FUNCTIONS
 # ============================================================================
@@ -297,6 +332,34 @@ def clean_cbs_value(value):
         return None
 
 
+def clean_cbs_values(values):
+    """
+    Vectorized counterpart of `clean_cbs_value` for a whole column.
+
+    Applies the same transformations with pandas string methods and a single
+    `pd.to_numeric(errors='coerce')`, so no Python call is made per cell.
+
+    **Parameters:**
+    - values (pandas.Series): Raw CBS cells (str, float, int, or NaN)
+
+    **Returns:**
+    - pandas.Series[float]: Cleaned values, NaN for suppressed/invalid data
+
+    **Example:**
+    ```python
+    df_long['expenditure_value'] = clean_cbs_values(df_long['expenditure_value'])
+    ```
+    """
+    value_str = (
+        values.astype(str)
+        .str.split('±', n=1).str[0]             # "5.8±0.3" → "5.8"
+        .str.replace(r'[(),]', '', regex=True)  # "(1,234)" → "1234"
+        .str.strip()
+    )
+
+    return pd.to_numeric(value_str.where(values.notna()), errors='coerce').abs()
+
+
 def is_skip_row(item_name):
     """
     Determine if a row should be skipped during ETL processing.
@@ -328,9 +391,10 @@ def is_skip_row(item_name):
     ```
 
     **Use Case:**
-    During pandas DataFrame processing, apply this filter:
+    Scalar reference implementation. For whole columns use `skip_row_mask`,
+    which applies the same rules as vectorized string operations:
     ```python
-    df_clean = df[~df['item_col'].apply(is_skip_row)]
+    df_clean = df[~skip_row_mask(df['item_col'])]
     ```
 
     This removes ~20-30 metadata rows per file, leaving 500-600 valid expenditure categories.
@@ -344,23 +408,79 @@ def is_skip_row(item_name):
     if not item_str:
         return True
     
-    # Skip error margin rows
-    if "±" in item_str:
-        return True
-    
-    # Skip footnotes like "(1)" at start
-    if item_str.startswith("(") and item_str[1].isdigit():
-        return True
-    
-    # Skip metadata rows
-    skip_keywords = ['TABLE', 'PUBLICATION', 'NIS', 'unless otherwise', 
-                     'Quintiles', 'Deciles', 'עשירונים', 'חמישונים']
-    if any(kw in item_str for kw in skip_keywords):
+    # Skip error margin rows, footnotes like "(1)" and metadata rows
+    if _SKIP_ROW_RE.search(item_str):
         return True
     
     return False
 
 
+def skip_row_mask(items):
+    """
+    Vectorized counterpart of `is_skip_row` for a whole item-name column.
+
+    Builds one boolean mask from column-wise string predicates instead of calling
+    `is_skip_row` once per row, so filtering runs in pandas/NumPy primitives.
+
+    **Parameters:**
+    - items (pandas.Series): Item names from the first column of a CBS Excel file
+
+    **Returns:**
+    - pandas.Series[bool]: True where the row should be skipped
+
+    **Example:**
+    ```python
+    df_clean = df[~skip_row_mask(df[item_col])]
+    ```
+    """
+    item_str = items.astype(str).str.strip()
+
+    return (
+        items.isna()
+        | item_str.eq('')
+        | item_str.str.contains(_SKIP_ROW_RE)
+    )
+
+
+def read_excel_cached(file_path, header_row):
+    """
+    Read a CBS sheet, reusing a pickled parse while the workbook is unchanged.
+
+    openpyxl parsing dominates each ETL run, yet the CBS files only change when
+    a new survey is published. The first read pickles the DataFrame under
+    EXCEL_CACHE_DIR; later reads load it as long as the pickle is at least as
+    new as the .xlsx. The pandas version is part of the cache key, an unreadable
+    pickle is re-parsed and rewritten, and an unwritable cache dir just means
+    reading uncached.
+
+    **Parameters:**
+    - file_path (Path): CBS Excel file
+    - header_row (int): Row passed to `pd.read_excel(header=...)` (part of the cache key)
+
+    **Returns:**
+    - pandas.DataFrame: Same frame `pd.read_excel(file_path, header=header_row)` returns
+    """
+    cache_path = EXCEL_CACHE_DIR / f"{file_path.stem}.header{header_row}.pandas{pd.__version__}.pkl"
+
+    if cache_path.exists() and cache_path.stat().st_mtime >= file_path.stat().st_mtime:
+        try:
+            return pd.read_pickle(cache_path)
+        except Exception:
+            # Truncated or corrupt pickle: fall through and rewrite it
+            pass
+
+    df = pd.read_excel(file_path, header=header_row)
+
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        df.to_pickle(cache_path)
+    except OSError:
+        # Read-only checkout/container: run without the cache
+        pass
+
+    return df
+
+
 # ============================================================================
 # MAIN ETL FUNCTION
 # ============================================================================
@@ -468,8 +588,8 @@ def process_segmentation_file(file_path, config):
     print(f"Table: {config['table_number']}")
     print(f"{'='*80}")
     
-    # Step 1: Read Excel with correct header row
-    df = pd.read_excel(file_path, header=header_row)
+    # Step 1: Read Excel with correct header row (cached after the first parse)
+    df = read_excel_cached(file_path, header_row)
     
     print(f"✅ Loaded {len(df)} rows")
     print(f"Columns: {df.columns.tolist()[:10]}")  # Show first 10 columns
@@ -479,7 +599,6 @@ def process_segmentation_file(file_path, config):
     
     if 'segment_pattern' in config:
         # Pattern-based (Income Quintile/Decile)
-        import re
         pattern = re.compile(config['segment_pattern'])
         segment_cols = [col for col in df.columns if pattern.match(str(col))]
     
@@ -507,10 +626,8 @@ def process_segmentation_file(file_path, config):
     print(f"✅ Item column: {item_col}")
     
     # Step 4: Clean and filter data
-    df_clean = df.copy()
-    
-    # Remove skip rows
-    df_clean = df_clean[~df_clean[item_col].apply(is_skip_row)]
+    # Boolean indexing already returns a new frame, so no defensive copy is needed
+    df_clean = df[~skip_row_mask(df[item_col])]
     
     print(f"✅ After filtering: {len(df_clean)} rows")
     
@@ -528,8 +645,11 @@ def process_segmentation_file(file_path, config):
     # Rename item column
     df_long = df_long.rename(columns={item_col: 'item_name'})
     
-    # Clean expenditure values
-    df_long['expenditure_value'] = df_long['expenditure_value'].apply(clean_cbs_value)
+    # Each segment label repeats once per item - keep it as categorical codes
+    df_long['segment_value'] = df_long['segment_value'].astype(str).astype('category')
+    
+    # Clean expenditure values (column-wise, no per-cell Python calls)
+    df_long['expenditure_value'] = clean_cbs_values(df_long['expenditure_value'])
     
     # Drop rows with no value
     df_long = df_long.dropna(subset=['expenditure_value'])
@@ -578,8 +698,9 @@ def load_to_database(df_long, segment_type, file_source):
     
     print(f"Segments to insert: {unique_segments}")
     
-    # Step 2: Insert segments into dim_segment
+    # Segments and facts share one connection and commit as one transaction
     with engine.begin() as conn:
+        # Step 2: Insert segments into dim_segment
         for idx, seg_value in enumerate(unique_segments):
             # Check if segment already exists
             result = conn.execute(text("""
@@ -613,40 +734,180 @@ def load_to_database(df_long, segment_type, file_source):
             else:
                 print(f"  ⏭️  Segment exists: {seg_value}")
     
-    # Step 3: Insert expenditures
-    with engine.begin() as conn:
-        for _, row in df_long.iterrows():
-            # Get segment_key
-            result = conn.execute(text("""
-                SELECT segment_key FROM dim_segment
-                WHERE segment_type = :seg_type AND segment_value = :seg_val
-            """), {"seg_type": segment_type, "seg_val": str(row['segment_value'])})
-            
-            segment_key = result.fetchone()[0]
-            
-            # Insert expenditure
-            conn.execute(text("""
-                INSERT INTO fact_segment_expenditure 
-                (item_name, segment_key, expenditure_value, is_income_metric, is_consumption_metric, metric_type)
-                VALUES (:item, :seg_key, :value, :is_income, :is_consumption, 'Monthly Spend')
-            """), {
-                "item": row['item_name'],
-                "seg_key": segment_key,
-                "value": float(row['expenditure_value']),
-                "is_income": bool(row['is_income_metric']),
-                "is_consumption": bool(row['is_consumption_metric'])
-            })
-        
-        print(f"✅ Inserted {len(df_long)} expenditure records")
+        # Step 3: Resolve segment keys once, then bulk-load expenditures
+        segment_keys = dict(conn.execute(text("""
+            SELECT segment_value, segment_key FROM dim_segment
+            WHERE segment_type = :seg_type
+        """), {"seg_type": segment_type}).fetchall())
+
+        # Categorical map touches each distinct segment once, not every row
+        segment_values = df_long['segment_value'].astype('category').cat.rename_categories(str)
+
+        df_facts = pd.DataFrame({
+            'item_name': df_long['item_name'],
+            'segment_key': segment_values.map(segment_keys),
+            'expenditure_value': df_long['expenditure_value'].astype(float),
+            'is_income_metric': df_long['is_income_metric'].astype(bool),
+            'is_consumption_metric': df_long['is_consumption_metric'].astype(bool),
+            'metric_type': 'Monthly Spend',
+        })
+
+        copy_expenditures(df_facts, conn)
+
+    print(f"✅ Inserted {len(df_long)} expenditure records")
+
+
+def _env_int(name):
+    """
+    Read an optional integer setting from the environment.
+
+    Returns None when the variable is unset or blank; raises ValueError naming
+    the variable when it is set to something that isn't an integer.
+    """
+    value = os.getenv(name, '').strip()
+    if not value:
+        return None
+
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer, got {value!r}") from None
+
+
+def get_batch_size(n_rows):
+    """
+    Pick the multi-row INSERT chunk size for the non-COPY fallback path.
+
+    `MARKETPULSE_BATCH_SIZE` overrides the default. Otherwise SQLite keeps
+    small 1,000-row chunks, MySQL/MariaDB/DuckDB use 50,000 and everything
+    else 10,000 - larger batches cut round-trips until the engine plateaus.
+
+    **Parameters:**
+    - n_rows (int): Number of rows about to be inserted
+
+    **Returns:**
+    - int: Rows per INSERT statement (never more than n_rows, at least 1)
+    """
+    override = _env_int(BATCH_SIZE_ENV)
+    if override is not None:
+        return max(1, min(n_rows, override))
+
+    dialect = engine.dialect.name
+    if dialect == 'sqlite':
+        default = 1_000
+    elif dialect in ('mysql', 'mariadb', 'duckdb'):
+        default = 50_000
+    else:
+        default = 10_000
+
+    return max(1, min(n_rows, default))
+
+
+def copy_expenditures(df_facts, conn):
+    """
+    Bulk-load fact rows into fact_segment_expenditure.
+
+    On PostgreSQL the rows are streamed through a single `COPY ... FROM STDIN`
+    (one round-trip, no per-row INSERT parse/plan). Other dialects fall back to
+    pandas `to_sql` multi-row inserts sized by `get_batch_size`.
+
+    **Parameters:**
+    - df_facts (pandas.DataFrame): Rows with the columns listed in FACT_COLUMNS
+    - conn (sqlalchemy.engine.Connection): Open connection; the caller's
+      transaction commits or rolls back the load
+    """
+    if conn.dialect.name != 'postgresql':
+        df_facts[list(FACT_COLUMNS)].to_sql(
+            'fact_segment_expenditure', conn, if_exists='append',
+            index=False, method='multi', chunksize=get_batch_size(len(df_facts))
+        )
+        return
+
+    buffer = io.StringIO()
+    df_facts.to_csv(buffer, columns=list(FACT_COLUMNS), index=False, header=False)
+    buffer.seek(0)
+
+    with conn.connection.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY fact_segment_expenditure ({', '.join(FACT_COLUMNS)}) "
+            "FROM STDIN WITH (FORMAT CSV)",
+            buffer
+        )
+
+
+def get_num_workers(n_files):
+    """
+    Pick how many processes extract/transform the CBS files in parallel.
+
+    `MARKETPULSE_ETL_WORKERS` opts in to a process pool; without it files are
+    processed sequentially so the progress output stays in order.
+
+    **Parameters:**
+    - n_files (int): Number of files about to be processed
+
+    **Returns:**
+    - int: Worker count (never more than n_files, at least 1)
+    """
+    override = _env_int(WORKERS_ENV)
+    if override is None:
+        return 1
+
+    return max(1, min(n_files, override))
+
+
+def copy_on_write():
+    """
+    Context enabling pandas Copy-on-Write for an ETL run.
+
+    CoW lets the filter -> melt -> rename chain and the fact frame share column
+    buffers instead of copying eagerly. It is always on from pandas 3.0; on 2.x
+    it is scoped to the run so importers of this module keep their semantics.
+    """
+    if int(pd.__version__.split('.')[0]) < 3:
+        return pd.option_context('mode.copy_on_write', True)
+    return nullcontext()
+
+
+def _process_file_worker(job):
+    """
+    Pool entry point: extract/transform one file, no database access.
+
+    Returns (filename, df_long, error) so one bad file does not abort the pool.
+    Enables Copy-on-Write itself since spawned workers don't inherit options.
+    """
+    file_path, config = job
+    try:
+        with copy_on_write():
+            return file_path.name, process_segmentation_file(file_path, config), None
+    except Exception:
+        return file_path.name, None, traceback.format_exc()
+
+
+def _load_file_worker(filename, df_long):
+    """
+    Loader thread entry point: load one processed file into the database.
+
+    Each file owns its own segment_type, so concurrent loads never touch the
+    same dim_segment rows. Returns a traceback string on failure, else None.
+    """
+    try:
+        load_to_database(df_long, SEGMENTATION_FILES[filename]['segment_type'], filename)
+    except Exception:
+        return traceback.format_exc()
+    return None
 
 
 # ============================================================================
 # MAIN EXECUTION
 # ============================================================================
 
-def main():
+def main(num_workers=None):
     """
     Process ALL CBS files and load to database.
+
+    Excel parsing and cleaning run in `num_workers` processes (see
+    `get_num_workers`); with more than one worker the database loads also
+    overlap in `num_workers` threads, otherwise files load one at a time.
     """
     print("\n" + "="*80)
     print("CBS DATA ETL - COMPLETE PIPELINE")
@@ -660,7 +921,8 @@ def main():
     loaded_files = []
     failed_files = []
     
-    # Process each file
+    # Collect files to process
+    jobs = []
     for filename, config in SEGMENTATION_FILES.items():
         file_path = data_dir / filename
         
@@ -669,23 +931,50 @@ def main():
             failed_files.append(filename)
             continue
         
-        try:
-            # Process file
-            df_long = process_segmentation_file(file_path, config)
+        jobs.append((file_path, config))
+    
+    if num_workers is None:
+        num_workers = get_num_workers(len(jobs))
+    
+    pool = Pool(num_workers) if num_workers > 1 else None
+    results = pool.imap(_process_file_worker, jobs) if pool else map(_process_file_worker, jobs)
+    
+    # Loads are I/O-bound round-trips, so with workers they overlap in threads
+    # (the driver releases the GIL while waiting on PostgreSQL)
+    loader = ThreadPoolExecutor(num_workers) if pool else None
+    loads = []
+    
+    # Process each file (results arrive in SEGMENTATION_FILES order)
+    try:
+        for filename, df_long, error in results:
+            if error is not None:
+                print(f"\n❌ ERROR processing {filename}:\n{error}")
+                failed_files.append(filename)
+                continue
             
             # Load to database
-            load_to_database(df_long, config['segment_type'], filename)
+            if loader:
+                loads.append((filename, len(df_long), loader.submit(_load_file_worker, filename, df_long)))
+            else:
+                loads.append((filename, len(df_long), _load_file_worker(filename, df_long)))
+        
+        for filename, n_records, outcome in loads:
+            error = outcome.result() if loader else outcome
+            if error is not None:
+                print(f"\n❌ ERROR processing {filename}:\n{error}")
+                failed_files.append(filename)
+                continue
             
-            total_records += len(df_long)
+            total_records += n_records
             loaded_files.append(filename)
             
-            print(f"✅ SUCCESS: {filename} ({len(df_long)} records)")
-        
-        except Exception as e:
-            print(f"\n❌ ERROR processing {filename}: {e}")
-            failed_files.append(filename)
-            import traceback
-            traceback.print_exc()
+            print(f"✅ SUCCESS: {filename} ({n_records} records)")
+    finally:
+        if pool:
+            pool.close()
+            pool.join()
+        if loader:
+            loader.shutdown()
     
     # Summary
     print(f"\n{'='*80}")
@@ -738,4 +1027,5 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    with copy_on_write():
+        main()
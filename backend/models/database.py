@@ -61,6 +61,7 @@ class DatabaseManager:
             max_overflow=10,  # Maximum overflow connections
             pool_pre_ping=True,  # Validate connections before using
             pool_recycle=3600,  # Recycle connections after 1 hour
+            pool_use_lifo=True,  # API: reuse the warmest connection so idle ones can recycle
             echo=False,  # Set to True for SQL query logging in development
         )
 
@@ -155,7 +156,6 @@ class DatabaseManager:
                 # Execute the entire file as one transaction
                 # This preserves functions, procedures, and triggers
                 connection.execute(text(sql_content))
-                connection.commit()
 
             logger.info(f"Successfully executed SQL file: {file_path}")
         except Exception as e:
@@ -6,43 +6,47 @@ Following the cleaning methodology from the user's pipeline
 import sys
 import pandas as pd
 import numpy as np
+import openpyxl
 from pathlib import Path
 
 sys.stdout.reconfigure(encoding='utf-8')
 
-def clean_cbs_value(val):
+def clean_cbs_columns(raw):
     """
-    Clean CBS values following the user's methodology:
+    Clean CBS values following the user's methodology, whole columns at once:
     - Remove commas from numbers
-    - Handle '..' (suppressed data) -> NaN or 0
-    - Handle '-' (no data) -> NaN or 0
+    - Handle '..' (suppressed data), '-' (no data) and blanks -> NaN
     - Handle '(value)' (low reliability) -> extract value
-    - Strip ± symbols (standard error rows)
-    """
-    if pd.isna(val):
-        return np.nan
+    - Flag ± symbols (standard error rows)
 
-    val_str = str(val).strip()
+    Returns (values, skip_cells): float frame with placeholders and
+    unparseable cells as NaN, and a boolean frame marking ± cells.
+    """
+    text = raw.apply(lambda col: col.astype(str).str.strip())
 
     # Filter noise: ± symbols indicate standard error rows
-    if '±' in val_str:
-        return 'SKIP_ROW'  # Signal to skip this row
+    skip_cells = raw.notna() & text.apply(lambda col: col.str.contains('±', regex=False))
+
+    # Remove parentheses (low reliability) and commas; CBS placeholders
+    # fail to parse and become NaN
+    values = text.apply(
+        lambda col: pd.to_numeric(col.str.replace(r'[(),]', '', regex=True), errors='coerce')
+    )
 
-    # Handle CBS placeholders
-    if val_str == '..' or val_str == '-' or val_str == '':
-        return np.nan
+    return values.where(raw.notna()), skip_cells
 
-    # Remove parentheses (low reliability indicator)
-    val_str = val_str.replace('(', '').replace(')', '')
 
-    # Remove commas from numbers
-    val_str = val_str.replace(',', '')
+def category_column(df):
+    """
+    First column as stripped category names.
 
-    # Try to convert to float
-    try:
-        return float(val_str)
-    except:
-        return np.nan
+    Returns (category, valid): the names, and a mask of rows that have one
+    (not missing, not blank, not the literal 'nan').
+    """
+    first = df.iloc[:, 0]
+    category = first.astype(str).str.strip()
+    valid = first.notna() & ~category.isin(['', 'nan'])
+    return category, valid
 
 
 def test_table_11_quintile_expenditure():
@@ -63,66 +67,61 @@ def test_table_11_quintile_expenditure():
 
     print(f"✅ Found file: {filepath.name}\n")
 
+    # Parse the workbook once; both reads below reuse the same handle
+    wb = openpyxl.load_workbook(filepath, data_only=True)
+
     # Load ALL rows to find the anchor row with quintile numbers (5, 4, 3, 2, 1)
-    df_raw = pd.read_excel(filepath, header=None, engine='openpyxl')
+    df_raw = pd.read_excel(wb, header=None, engine='openpyxl')
     print(f"📊 Loaded {len(df_raw)} raw rows from Excel\n")
 
     # Find anchor row (contains quintile numbers: 5, 4, 3, 2, 1)
-    anchor_row_idx = None
-    for idx, row in df_raw.iterrows():
-        row_str = ' '.join([str(x) for x in row if pd.notna(x)])
-        if '5' in row_str and '4' in row_str and '3' in row_str and '2' in row_str and '1' in row_str:
-            # Check if it's the quintile header (not data)
-            if 'quintile' in row_str.lower() or idx < 10:
-                anchor_row_idx = idx
-                print(f"🎯 ANCHOR ROW FOUND at index {idx}: {row.tolist()[:10]}")
-                break
+    # Checked per cell across the whole sheet at once; a single character (or
+    # the word 'quintile') can't span two cells of the joined row text
+    cells = df_raw.apply(lambda col: col.astype(str).where(col.notna(), ''))
+
+    def row_contains(pattern):
+        return cells.apply(lambda col: col.str.contains(pattern, regex=False)).any(axis=1)
+
+    has_quintile_numbers = np.logical_and.reduce([row_contains(digit) for digit in '54321'])
+
+    # Check if it's the quintile header (not data)
+    is_header = (
+        cells.apply(lambda col: col.str.lower().str.contains('quintile', regex=False)).any(axis=1)
+        | (df_raw.index < 10)
+    )
+
+    anchor_rows = df_raw.index[has_quintile_numbers & is_header]
+    anchor_row_idx = int(anchor_rows[0]) if len(anchor_rows) else None
+    if anchor_row_idx is not None:
+        print(f"🎯 ANCHOR ROW FOUND at index {anchor_row_idx}: {df_raw.loc[anchor_row_idx].tolist()[:10]}")
 
     if anchor_row_idx is None:
         print("❌ Could not find anchor row with quintile numbers!")
         return
 
     # Reload with correct header
-    df = pd.read_excel(filepath, header=anchor_row_idx, engine='openpyxl')
+    df = pd.read_excel(wb, header=anchor_row_idx, engine='openpyxl')
     print(f"\n📋 Columns after anchor: {df.columns.tolist()[:10]}\n")
 
-    # Clean data
-    cleaned_rows = []
-    skipped_error_rows = 0
-
-    for idx, row in df.iterrows():
-        # Get category name (first column)
-        category = str(row.iloc[0]).strip() if pd.notna(row.iloc[0]) else None
-
-        if not category or category == 'nan':
-            continue
-
-        # Check if this is a standard error row (contains ±)
-        if '±' in category:
-            skipped_error_rows += 1
-            continue
-
-        # Extract quintile values (columns should be Q5, Q4, Q3, Q2, Q1, Total)
-        # We need to identify which columns contain the quintile data
-        values = []
-        for i in range(1, min(8, len(row))):  # Check first 7 columns after category
-            cleaned = clean_cbs_value(row.iloc[i])
-            if cleaned == 'SKIP_ROW':
-                break
-            values.append(cleaned)
-
-        if len(values) >= 6:  # Need at least Q5, Q4, Q3, Q2, Q1, Total
-            cleaned_rows.append({
-                'category': category,
-                'Q5': values[0] if len(values) > 0 else np.nan,
-                'Q4': values[1] if len(values) > 1 else np.nan,
-                'Q3': values[2] if len(values) > 2 else np.nan,
-                'Q2': values[3] if len(values) > 3 else np.nan,
-                'Q1': values[4] if len(values) > 4 else np.nan,
-                'Total': values[5] if len(values) > 5 else np.nan,
-            })
-
-    df_cleaned = pd.DataFrame(cleaned_rows)
+    # Clean data (whole columns at once)
+    category, valid = category_column(df)
+
+    # Check if this is a standard error row (contains ±)
+    error_rows = valid & category.str.contains('±', regex=False)
+    skipped_error_rows = int(error_rows.sum())
+
+    # Extract quintile values (columns should be Q5, Q4, Q3, Q2, Q1, Total)
+    # from the first 7 columns after category; a ± cell cuts the row short
+    values, skip_cells = clean_cbs_columns(df.iloc[:, 1:8])
+    complete = ~skip_cells.iloc[:, :6].any(axis=1) if values.shape[1] >= 6 else False
+
+    keep = valid & ~error_rows & complete  # Need at least Q5, Q4, Q3, Q2, Q1, Total
+
+    df_cleaned = pd.DataFrame(
+        values[keep].iloc[:, :6].to_numpy(),
+        columns=['Q5', 'Q4', 'Q3', 'Q2', 'Q1', 'Total']
+    )
+    df_cleaned.insert(0, 'category', category[keep].to_numpy())
 
     print(f"✅ CLEANED {len(df_cleaned)} data rows")
     print(f"🗑️  SKIPPED {skipped_error_rows} standard error rows (±)\n")
@@ -169,50 +168,28 @@ def test_table_38_store_type():
     print(f"📊 Loaded {len(df)} rows from Excel")
     print(f"📋 Columns: {df.columns.tolist()}\n")
 
-    # Clean data
-    cleaned_rows = []
-    skipped_error_rows = 0
-
-    for idx, row in df.iterrows():
-        category = str(row.iloc[0]).strip() if pd.notna(row.iloc[0]) else None
-
-        if not category or category == 'nan':
-            continue
-
-        # Skip error margin rows
-        if '±' in category:
-            skipped_error_rows += 1
-            continue
-
-        # Extract store type values (columns 1-9)
-        values = []
-        for i in range(1, 10):  # 8 store types + total
-            if i >= len(row):
-                break
-            cleaned = clean_cbs_value(row.iloc[i])
-            if cleaned == 'SKIP_ROW':
-                break
-            values.append(cleaned if pd.notna(cleaned) else 0.0)
-
-        if len(values) >= 9:  # Need all 8 store types + total
-            row_sum = sum(values[:8])
-            total = values[8] if len(values) > 8 else row_sum
-
-            cleaned_rows.append({
-                'category': category,
-                'other': values[0],
-                'special_shop': values[1],
-                'butcher': values[2],
-                'veg_fruit_shop': values[3],
-                'online_supermarket': values[4],
-                'supermarket_chain': values[5],
-                'market': values[6],
-                'grocery': values[7],
-                'total': total,
-                'calculated_sum': row_sum,
-            })
-
-    df_cleaned = pd.DataFrame(cleaned_rows)
+    # Clean data (whole columns at once)
+    category, valid = category_column(df)
+
+    # Skip error margin rows
+    error_rows = valid & category.str.contains('±', regex=False)
+    skipped_error_rows = int(error_rows.sum())
+
+    # Extract store type values (columns 1-9: 8 store types + total);
+    # a ± cell cuts the row short, missing values count as 0
+    values, skip_cells = clean_cbs_columns(df.iloc[:, 1:10])
+    complete = ~skip_cells.any(axis=1) if values.shape[1] >= 9 else False
+
+    keep = valid & ~error_rows & complete  # Need all 8 store types + total
+    values = values[keep].fillna(0.0)
+
+    df_cleaned = pd.DataFrame(
+        values.to_numpy(),
+        columns=['other', 'special_shop', 'butcher', 'veg_fruit_shop', 'online_supermarket',
+                 'supermarket_chain', 'market', 'grocery', 'total']
+    )
+    df_cleaned.insert(0, 'category', category[keep].to_numpy())
+    df_cleaned['calculated_sum'] = values.iloc[:, :8].sum(axis=1).to_numpy()
 
     print(f"✅ CLEANED {len(df_cleaned)} data rows")
     print(f"🗑️  SKIPPED {skipped_error_rows} standard error rows (±)\n")
@@ -266,38 +243,29 @@ def test_table_40_digital_matrix():
 
     print(f"✅ Found file: {filepath.name}\n")
 
+    # Parse the workbook once; both reads below reuse the same handle
+    wb = openpyxl.load_workbook(filepath, data_only=True)
+
     # Load raw to find header
-    df_raw = pd.read_excel(filepath, header=None, engine='openpyxl')
+    df_raw = pd.read_excel(wb, header=None, engine='openpyxl')
     print(f"📊 Loaded {len(df_raw)} raw rows\n")
 
     # Use header row 7 (common CBS format)
-    df = pd.read_excel(filepath, header=7, engine='openpyxl')
+    df = pd.read_excel(wb, header=7, engine='openpyxl')
     print(f"📋 Columns: {df.columns.tolist()[:10]}\n")
 
-    # Clean and show sample
-    cleaned_rows = []
-    for idx, row in df.iterrows():
-        category = str(row.iloc[0]).strip() if pd.notna(row.iloc[0]) else None
-        if not category or category == 'nan' or '±' in category:
-            continue
-
-        # Extract purchase method percentages
-        values = []
-        for i in range(1, 4):  # Physical, Online Israel, Online Abroad
-            cleaned = clean_cbs_value(row.iloc[i])
-            values.append(cleaned if pd.notna(cleaned) else 0.0)
-
-        if len(values) >= 3:
-            total = sum(values)
-            cleaned_rows.append({
-                'category': category,
-                'physical': values[0],
-                'online_israel': values[1],
-                'online_abroad': values[2],
-                'total': total
-            })
-
-    df_cleaned = pd.DataFrame(cleaned_rows)
+    # Clean and show sample (whole columns at once)
+    category, valid = category_column(df)
+
+    # Extract purchase method percentages (Physical, Online Israel, Online Abroad);
+    # rows with a ± in the category or values are standard error rows
+    values, skip_cells = clean_cbs_columns(df.iloc[:, 1:4])
+    keep = valid & ~category.str.contains('±', regex=False) & ~skip_cells.any(axis=1)
+    values = values[keep].fillna(0.0)
+
+    df_cleaned = pd.DataFrame(values.to_numpy(), columns=['physical', 'online_israel', 'online_abroad'])
+    df_cleaned.insert(0, 'category', category[keep].to_numpy())
+    df_cleaned['total'] = values.sum(axis=1).to_numpy()
     print(f"✅ CLEANED {len(df_cleaned)} rows\n")
     print("📊 SAMPLE DATA:")
     print(df_cleaned.head(5).to_string(index=False))
@@ -29,7 +29,12 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from etl.load_segmentation import (
     clean_cbs_value,
+    clean_cbs_values,
     is_skip_row,
+    skip_row_mask,
+    get_batch_size,
+    get_num_workers,
+    read_excel_cached,
     SEGMENTATION_FILES
 )
 
@@ -96,6 +101,24 @@ def test_clean_cbs_value_combined_notation():
     assert clean_cbs_value("(1,234±12)") == 1234.0
 
 
+def test_clean_cbs_values_matches_clean_cbs_value():
+    """Test vectorized cleaning agrees with the scalar cleaner cell by cell"""
+    raw = pd.Series(
+        ["5.8±0.3", "..", "(42.3)", "1,234.5", "-5.2", np.nan, "abc", "  67.8  ",
+         "(1,234±12)", 12, -3.5, "-", ""],
+        dtype=object
+    )
+
+    expected = [clean_cbs_value(v) for v in raw]
+    result = clean_cbs_values(raw)
+
+    for value, exp, res in zip(raw, expected, result):
+        if exp is None:
+            assert pd.isna(res), f"Expected NaN for {value!r}"
+        else:
+            assert res == pytest.approx(exp), f"Cleaning mismatch for {value!r}"
+
+
 # =============================================================================
 # Test Suite 2: Row Skipping Logic
 # =============================================================================
@@ -152,6 +175,19 @@ def test_is_skip_row_numbers():
     assert is_skip_row("42.5") is False
 
 
+def test_skip_row_mask_matches_is_skip_row():
+    """Test vectorized skip mask agrees with the scalar is_skip_row rules"""
+    items = pd.Series([
+        "Food and beverages", "Housing", "± Standard error", "(1) Footnote text",
+        "TABLE 1.1", "In NIS unless otherwise stated", "עשירונים", "חמישונים",
+        "table 1.1", "   ", "", None, np.nan, "123", "(42.3)", "Net money income per household",
+    ], dtype=object)
+
+    expected = [is_skip_row(item) for item in items]
+
+    assert skip_row_mask(items).tolist() == expected
+
+
 # =============================================================================
 # Test Suite 3: Segment Pattern Matching
 # =============================================================================
@@ -378,6 +414,51 @@ def test_mock_data_cleaning_pipeline(mock_excel_data):
         assert result == expected_result, f"Cleaning failed for {value}"
 
 
+def test_read_excel_cached_reuses_parse(mock_excel_data, tmp_path, monkeypatch):
+    """Test the second read of an unchanged workbook comes from the cache"""
+    monkeypatch.setattr('etl.load_segmentation.EXCEL_CACHE_DIR', tmp_path / 'cache')
+    file_path = tmp_path / 'Income_Decile.xlsx'
+    mock_excel_data.to_excel(file_path, index=False)
+
+    first = read_excel_cached(file_path, header_row=0)
+    assert (tmp_path / 'cache' / f'Income_Decile.header0.pandas{pd.__version__}.pkl').exists()
+
+    with patch('etl.load_segmentation.pd.read_excel') as read_excel:
+        second = read_excel_cached(file_path, header_row=0)
+
+    read_excel.assert_not_called()
+    pd.testing.assert_frame_equal(first, second)
+
+
+def test_read_excel_cached_rewrites_corrupt_pickle(mock_excel_data, tmp_path, monkeypatch):
+    """Test an unreadable pickle falls back to read_excel and is rewritten"""
+    monkeypatch.setattr('etl.load_segmentation.EXCEL_CACHE_DIR', tmp_path / 'cache')
+    file_path = tmp_path / 'Income_Decile.xlsx'
+    mock_excel_data.to_excel(file_path, index=False)
+
+    expected = read_excel_cached(file_path, header_row=0)
+    cache_path = tmp_path / 'cache' / f'Income_Decile.header0.pandas{pd.__version__}.pkl'
+    cache_path.write_bytes(b'truncated')
+
+    result = read_excel_cached(file_path, header_row=0)
+
+    pd.testing.assert_frame_equal(result, expected)
+    pd.testing.assert_frame_equal(pd.read_pickle(cache_path), expected)
+
+
+def test_read_excel_cached_without_writable_cache(mock_excel_data, tmp_path, monkeypatch):
+    """Test a cache dir that can't be created still returns the parsed sheet"""
+    blocker = tmp_path / 'not_a_dir'
+    blocker.write_text('')
+    monkeypatch.setattr('etl.load_segmentation.EXCEL_CACHE_DIR', blocker / 'cache')
+    file_path = tmp_path / 'Income_Decile.xlsx'
+    mock_excel_data.to_excel(file_path, index=False)
+
+    result = read_excel_cached(file_path, header_row=0)
+
+    pd.testing.assert_frame_equal(result, pd.read_excel(file_path, header=0))
+
+
 # =============================================================================
 # Test Suite 8: Edge Cases and Error Handling
 # =============================================================================
@@ -491,6 +572,53 @@ def test_segment_order_logic():
         assert decile_pattern.match(str(i)), f"Decile pattern should match {i}"
 
 
+# =============================================================================
+# Test Suite 11: Database Loading
+# =============================================================================
+
+def test_batch_size_env_override(monkeypatch):
+    """Test MARKETPULSE_BATCH_SIZE overrides the dialect default"""
+    monkeypatch.setenv("MARKETPULSE_BATCH_SIZE", "2500")
+
+    assert get_batch_size(100_000) == 2500
+    assert get_batch_size(300) == 300
+
+
+def test_batch_size_env_override_must_be_integer(monkeypatch):
+    """Test a non-integer MARKETPULSE_BATCH_SIZE fails with a clear message"""
+    monkeypatch.setenv("MARKETPULSE_BATCH_SIZE", "lots")
+
+    with pytest.raises(ValueError, match="MARKETPULSE_BATCH_SIZE"):
+        get_batch_size(100)
+
+
+def test_batch_size_capped_by_row_count(monkeypatch):
+    """Test batch size never exceeds the number of rows to insert"""
+    monkeypatch.delenv("MARKETPULSE_BATCH_SIZE", raising=False)
+
+    assert get_batch_size(42) == 42
+    assert get_batch_size(0) == 1
+
+
+def test_num_workers_defaults_to_sequential(monkeypatch):
+    """Test files are processed in-process unless workers are requested"""
+    monkeypatch.delenv("MARKETPULSE_ETL_WORKERS", raising=False)
+
+    assert get_num_workers(8) == 1
+
+    monkeypatch.setenv("MARKETPULSE_ETL_WORKERS", "4")
+    assert get_num_workers(8) == 4
+    assert get_num_workers(2) == 2
+
+
+def test_num_workers_env_must_be_integer(monkeypatch):
+    """Test a non-integer MARKETPULSE_ETL_WORKERS fails with a clear message"""
+    monkeypatch.setenv("MARKETPULSE_ETL_WORKERS", "auto")
+
+    with pytest.raises(ValueError, match="MARKETPULSE_ETL_WORKERS"):
+        get_num_workers(8)
+
+
 # =============================================================================
 # Test Summary
 # =============================================================================
@@ -570,6 +570,18 @@ def test_inequality_ratio_calculation_accuracy():
                 assert abs(actual - expected) < 0.01, f"Inequality ratio mismatch for {inequality['item_name']}"
 
 
+def test_segment_value_adapter_matches_per_item_validation():
+    """Test batch TypeAdapter validation matches building each item on its own"""
+    from api.segmentation_endpoints import SegmentValueItem, _segment_value_items
+
+    rows = [
+        {"segment_value": f"Segment {i}", "segment_order": i if i % 10 else None}
+        for i in range(1000)
+    ]
+
+    assert _segment_value_items.validate_python(rows) == [SegmentValueItem(**row) for row in rows]
+
+
 # =============================================================================
 # Test Suite 8: Error Handling and Edge Cases
 # =============================================================================
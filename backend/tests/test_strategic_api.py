@@ -17,7 +17,7 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 
 from api.main import app
-from api.strategic_endpoints import get_db_session
+from api.strategic_endpoints import get_db_session, clear_response_cache
 
 
 # =============================================================================
@@ -404,6 +404,110 @@ class TestStrategicAPIPerformance:
         assert elapsed < 0.5, f"Response took {elapsed:.2f}s, should be < 0.5s"
 
 
+# =============================================================================
+# Unit Tests - Response Cache
+# =============================================================================
+
+class TestStrategicResponseCache:
+    """Test that parameterless strategic endpoints reuse their first response"""
+
+    def test_burn_rate_cached_after_first_request(self, test_client, mock_db_session):
+        """Second request is served without touching the database"""
+        mock_db_session.execute.return_value.fetchone.return_value = MagicMock(
+            q5_burn_rate_pct=60.0,
+            q4_burn_rate_pct=70.0,
+            q3_burn_rate_pct=80.0,
+            q2_burn_rate_pct=90.0,
+            q1_burn_rate_pct=95.0,
+            total_burn_rate_pct=75.0
+        )
+
+        clear_response_cache()
+        app.dependency_overrides[get_db_session] = lambda: mock_db_session
+
+        first = test_client.get("/api/strategic/burn-rate")
+        second = test_client.get("/api/strategic/burn-rate")
+
+        assert first.status_code == 200
+        assert second.json() == first.json()
+        assert mock_db_session.execute.call_count == 1
+
+        app.dependency_overrides.clear()
+        clear_response_cache()
+
+
+# =============================================================================
+# Unit Tests - Row Validation
+# =============================================================================
+
+class TestStrategicRowValidation:
+    """Test that result rows are validated into models in one pass"""
+
+    def test_inequality_gap_coerces_decimal_rows(self, test_client, mock_db_session):
+        """NUMERIC (Decimal) columns come back as floats"""
+        from decimal import Decimal
+
+        mock_db_session.execute.return_value.mappings.return_value.all.return_value = [
+            {'item_name': 'Jewelry', 'rich_spend': Decimal('120.5'),
+             'poor_spend': Decimal('10.0'), 'gap_ratio': Decimal('12.05'),
+             'total_spend': Decimal('300.0')},
+            {'item_name': 'Bread', 'rich_spend': Decimal('95.1'),
+             'poor_spend': Decimal('74.4'), 'gap_ratio': Decimal('1.28'),
+             'total_spend': Decimal('425.5')},
+        ]
+
+        clear_response_cache()
+        app.dependency_overrides[get_db_session] = lambda: mock_db_session
+
+        response = test_client.get("/api/strategic/inequality-gap")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data['top_gaps']) == 2
+        assert data['top_gaps'][0]['gap_ratio'] == 12.05
+        assert 'Jewelry' in data['insight']
+
+        app.dependency_overrides.clear()
+        clear_response_cache()
+
+    def test_constructed_envelope_matches_validated(self):
+        """model_construct over validated items serializes like full validation"""
+        from api.strategic_endpoints import InequalityGapResponse, _inequality_gap_items
+
+        rows = [
+            {'item_name': 'Jewelry', 'rich_spend': 120.5, 'poor_spend': 10.0,
+             'gap_ratio': 12.05, 'total_spend': 300.0},
+        ]
+        items = _inequality_gap_items.validate_python(rows)
+
+        constructed = InequalityGapResponse.model_construct(top_gaps=items, insight="test")
+        validated = InequalityGapResponse.model_validate({'top_gaps': rows, 'insight': "test"})
+
+        assert constructed == validated
+        assert constructed.model_dump_json() == validated.model_dump_json()
+
+    def test_expenditures_serialized_as_json(self, test_client, mock_db_session):
+        """Uncached endpoints return the pydantic-core JSON body"""
+        mock_db_session.execute.return_value.mappings.return_value.all.return_value = [
+            {'item_name': 'Bread', 'q5_spend': 95.1, 'q4_spend': 90.0, 'q3_spend': 85.2,
+             'q2_spend': 80.3, 'q1_spend': 74.4, 'total_spend': 425.0,
+             'inequality_index': 1.28, 'total_categories': 520},
+        ]
+
+        app.dependency_overrides[get_db_session] = lambda: mock_db_session
+
+        response = test_client.get("/api/strategic/expenditures?limit=1")
+
+        assert response.status_code == 200
+        assert response.headers['content-type'] == 'application/json'
+        data = response.json()
+        assert data['total_categories'] == 520
+        assert data['expenditures'][0]['item_name'] == 'Bread'
+        assert 'total_categories' not in data['expenditures'][0]
+
+        app.dependency_overrides.clear()
+
+
 # =============================================================================
 # Security Tests
 # =============================================================================